@@ -1,24 +1,47 @@
 use msyt::{Endianness, Msyt};
+use once_cell::sync::Lazy;
 use pyo3::{
+    buffer::PyBuffer,
     create_exception,
     exceptions::PyException,
     prelude::*,
-    types::{PyBytes, PyDict, PyString},
+    types::{PyBool, PyBytes, PyDict, PyFloat, PyList, PyLong, PyString, PyTuple},
     wrap_pyfunction,
 };
 use rayon::prelude::*;
+use serde_json::{Map, Number, Value};
 use std::{
+    collections::{BTreeMap, BTreeSet, HashMap},
+    ffi::OsStr,
     fs,
-    path::{Path, PathBuf},
+    io::{BufWriter, Write},
+    path::{Component, Path, PathBuf},
+    sync::{Arc, Mutex},
+    time::SystemTime,
 };
 
 create_exception!(pymsyt, MsytError, PyException);
 
+/// MSBT files parsed with caching enabled, keyed by their canonical path.
+static MSYT_CACHE: Lazy<Mutex<BTreeMap<PathBuf, CachedMsyt>>> =
+    Lazy::new(|| Mutex::new(BTreeMap::new()));
+
+/// A parsed MSBT file along with the modification time and size it had when parsed, so
+/// that it is only reused while the file on disk is unchanged.
+struct CachedMsyt {
+    modified: SystemTime,
+    len: u64,
+    msyt: Arc<Msyt>,
+}
+
 #[pymodule]
 fn pymsyt(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<Msbt>()?;
     m.add_wrapped(wrap_pyfunction!(create)).unwrap();
     m.add_wrapped(wrap_pyfunction!(export)).unwrap();
+    m.add_wrapped(wrap_pyfunction!(read_msbt_dir)).unwrap();
+    m.add_wrapped(wrap_pyfunction!(write_msbt_dir)).unwrap();
+    m.add_wrapped(wrap_pyfunction!(clear_cache)).unwrap();
     Ok(())
 }
 
@@ -33,66 +56,63 @@ fn pymsyt(_py: Python, m: &PyModule) -> PyResult<()> {
 /// :raises MsytError: Raises an `MsytError` if export fails for any reason.
 #[pyfunction]
 #[text_signature = "(input, output=None, json=False)"]
-fn export(input: String, output: Option<String>, json: Option<bool>) -> PyResult<()> {
+fn export(py: Python, input: &str, output: Option<&str>, json: Option<bool>) -> PyResult<()> {
     fn export_single<P: AsRef<Path>>(input: P, output: P, json: bool) -> PyResult<()> {
         let msyt = Msyt::from_msbt_file(&input)
             .map_err(|e| MsytError::new_err(format!("Could not read MSBT file: {:?}", e)))?;
-        fs::create_dir_all(output.as_ref().parent().unwrap()).map_err(|e| {
-            MsytError::new_err(format!(
-                "Could not create parent folder for MSYT file: {:?}",
-                e
-            ))
-        })?;
-        let mut file = fs::File::create(&output)?;
+        let mut writer = BufWriter::new(fs::File::create(&output)?);
         match json {
-            true => serde_json::to_writer(&mut file, &msyt).map_err(|e| {
+            true => serde_json::to_writer(&mut writer, &msyt).map_err(|e| {
                 MsytError::new_err(format!("Could not serialize MSBT to JSON: {:?}", e))
             }),
-            false => serde_yaml::to_writer(&mut file, &msyt).map_err(|e| {
+            false => serde_yaml::to_writer(&mut writer, &msyt).map_err(|e| {
                 MsytError::new_err(format!("Could not serialize MSBT to YAML: {:?}", e))
             }),
-        }
+        }?;
+        writer.flush()?;
+        Ok(())
     }
 
-    let input: PathBuf = input.into();
-    if input.is_dir() {
-        let output: PathBuf = if let Some(output) = output {
-            output.into()
-        } else {
-            input.clone()
-        };
-        fs::create_dir_all(&output)
-            .map_err(|e| MsytError::new_err(format!("Could not create output folder: {:?}", e)))?;
-        let paths: Vec<PathBuf> = glob::glob(input.join("**/*.msbt").to_str().unwrap())
-            .unwrap()
-            .filter_map(|f| f.ok())
-            .collect();
-        paths
-            .par_iter()
-            .try_for_each(|f| {
-                export_single(
-                    f,
-                    &output
-                        .join(f.strip_prefix(&input).unwrap())
-                        .with_extension("msyt"),
-                    json.unwrap_or(false),
-                )
-            })
-            .map_err(|e| MsytError::new_err(format!("Failed to create MSYT files: {:?}", e)))?;
-        Ok(())
-    } else if input.is_file() {
-        let output = if let Some(output) = output {
-            output.into()
+    py.allow_threads(|| -> PyResult<()> {
+        let input = Path::new(input);
+        let (is_dir, is_file) =
+            fs::metadata(input).map_or((false, false), |m| (m.is_dir(), m.is_file()));
+        if is_dir {
+            let output: PathBuf = if let Some(output) = output {
+                output.into()
+            } else {
+                input.to_path_buf()
+            };
+            fs::create_dir_all(&output).map_err(|e| {
+                MsytError::new_err(format!("Could not create output folder: {:?}", e))
+            })?;
+            let jobs: Vec<(PathBuf, PathBuf)> = find_files(input, "msbt")?
+                .into_iter()
+                .map(|f| {
+                    let out = output_path(input, &output, &f, "msyt");
+                    (f, out)
+                })
+                .collect();
+            create_parents(jobs.iter().map(|(_, out)| out.as_path()))?;
+            jobs.par_iter()
+                .try_for_each(|(f, out)| export_single(f, out, json.unwrap_or(false)))
+                .map_err(|e| MsytError::new_err(format!("Failed to create MSYT files: {:?}", e)))?;
+            Ok(())
+        } else if is_file {
+            let output = if let Some(output) = output {
+                output.into()
+            } else {
+                input.with_extension("msyt")
+            };
+            create_parents(std::iter::once(output.as_path()))?;
+            export_single(input, output.as_path(), json.unwrap_or(false))
         } else {
-            input.with_extension("msyt")
-        };
-        export_single(&input, &output, json.unwrap_or(false))
-    } else {
-        Err(MsytError::new_err(format!(
-            "{} is not a valid file or folder",
-            input.to_string_lossy()
-        )))
-    }
+            Err(MsytError::new_err(format!(
+                "{} is not a valid file or folder",
+                input.to_string_lossy()
+            )))
+        }
+    })
 }
 
 /// Creates an MSBT file or directory of MSBT files from YAML or JSON.
@@ -106,76 +126,329 @@ fn export(input: String, output: Option<String>, json: Option<bool>) -> PyResult
 /// :raises MsytError: Raises an `MsytError` if export fails for any reason.
 #[pyfunction]
 #[text_signature = "(input, big_endian, output=None)"]
-fn create(input: String, big_endian: bool, output: Option<String>) -> PyResult<()> {
+fn create(py: Python, input: &str, big_endian: bool, output: Option<&str>) -> PyResult<()> {
     fn create_single<P: AsRef<Path>>(input: P, output: P, big_endian: bool) -> PyResult<()> {
         let text = fs::read_to_string(input)?;
-        let msyt: Msyt = match serde_yaml::from_str(&text) {
-            Ok(m) => m,
-            Err(_) => serde_json::from_str(&text).map_err(|e| {
-                MsytError::new_err(format!(
-                    "Could not parse text as valid MSYT YAML or JSON: {:?}",
-                    e
-                ))
-            })?,
-        };
-        fs::create_dir_all(output.as_ref().parent().unwrap()).map_err(|e| {
-            MsytError::new_err(format!(
-                "Could not create parent folder for MSBT file: {:?}",
-                e
-            ))
-        })?;
-        msyt.write_as_msbt(
-            &mut fs::File::create(output)?,
-            match big_endian {
-                true => Endianness::Big,
-                false => Endianness::Little,
-            },
-        )
-        .map_err(|e| MsytError::new_err(format!("Could not write MSBT file: {:?}", e)))?;
+        let msyt = parse_msyt_text(&text, "Could not parse text as valid MSYT YAML or JSON")?;
+        let mut writer = BufWriter::new(fs::File::create(output)?);
+        msyt.write_as_msbt(&mut writer, endianness(big_endian))
+            .map_err(|e| MsytError::new_err(format!("Could not write MSBT file: {:?}", e)))?;
+        writer.flush()?;
         Ok(())
     }
 
-    let input: PathBuf = input.into();
-    if input.is_dir() {
-        let output: PathBuf = if let Some(output) = output {
-            output.into()
+    py.allow_threads(|| -> PyResult<()> {
+        let input = Path::new(input);
+        let (is_dir, is_file) =
+            fs::metadata(input).map_or((false, false), |m| (m.is_dir(), m.is_file()));
+        if is_dir {
+            let output: PathBuf = if let Some(output) = output {
+                output.into()
+            } else {
+                input.to_path_buf()
+            };
+            fs::create_dir_all(&output).map_err(|e| {
+                MsytError::new_err(format!("Could not create output folder: {:?}", e))
+            })?;
+            let jobs: Vec<(PathBuf, PathBuf)> = find_files(input, "msyt")?
+                .into_iter()
+                .map(|f| {
+                    let out = output_path(input, &output, &f, "msbt");
+                    (f, out)
+                })
+                .collect();
+            create_parents(jobs.iter().map(|(_, out)| out.as_path()))?;
+            jobs.par_iter()
+                .try_for_each(|(f, out)| create_single(f, out, big_endian))
+                .map_err(|e| MsytError::new_err(format!("Failed to create MSBT files: {:?}", e)))?;
+            Ok(())
+        } else if is_file {
+            let output = if let Some(output) = output {
+                output.into()
+            } else {
+                input.with_extension("msbt")
+            };
+            create_parents(std::iter::once(output.as_path()))?;
+            create_single(input, output.as_path(), big_endian)
         } else {
-            input.clone()
-        };
-        fs::create_dir_all(&output)
-            .map_err(|e| MsytError::new_err(format!("Could not create output folder: {:?}", e)))?;
-        let paths: Vec<PathBuf> = glob::glob(input.join("**/*.msyt").to_str().unwrap())
-            .unwrap()
-            .filter_map(|f| f.ok())
-            .collect();
+            Err(MsytError::new_err(format!(
+                "{} is not a valid file or folder",
+                input.to_string_lossy()
+            )))
+        }
+    })
+}
+
+/// Reads every MSBT file in a folder (recursively) in a single call. The files are parsed in
+/// parallel without holding the GIL, so this is much faster than looping over the files in
+/// Python and parsing each one with `Msbt.from_binary()`.
+///
+/// :param input: The folder of MSBT files to read
+/// :type input: str (**must** be str, cannot be pathlike)
+/// :param cache: Whether to reuse (and keep) parsed copies of files while they are unchanged
+/// :type cache: bool, optional. Defaults to False.
+/// :return: Returns a dict of each file's path relative to `input` and its parsed `pymsyt.Msbt`.
+/// :rtype: dict
+/// :raises MsytError: Raises an `MsytError` if any of the files cannot be read.
+#[pyfunction]
+#[text_signature = "(input, cache=False)"]
+fn read_msbt_dir(py: Python, input: &str, cache: Option<bool>) -> PyResult<BTreeMap<String, Msbt>> {
+    let input = Path::new(input);
+    py.allow_threads(|| -> PyResult<BTreeMap<String, Msbt>> {
+        if !input.is_dir() {
+            return Err(MsytError::new_err(format!(
+                "{} is not a valid folder",
+                input.to_string_lossy()
+            )));
+        }
+        let paths = find_files(input, "msbt")?;
         paths
             .par_iter()
-            .try_for_each(|f| {
-                create_single(
-                    f,
-                    &output
-                        .join(f.strip_prefix(&input).unwrap())
-                        .with_extension("msbt"),
-                    big_endian,
-                )
+            .map(|f| -> PyResult<(String, Msbt)> {
+                let msyt = read_msbt_file(f, cache.unwrap_or(false))?;
+                Ok((relative_name(input, f), Msbt { msyt }))
+            })
+            .collect()
+    })
+}
+
+/// Writes a set of MSBT files into a folder in a single call. This is the counterpart to
+/// `read_msbt_dir()`, and likewise writes the files in parallel without holding the GIL.
+///
+/// :param msbts: A dict of each file's path relative to `output` and the `pymsyt.Msbt` to write
+/// :type msbts: dict
+/// :param output: The folder to write the MSBT files to
+/// :type output: str (**must** be str, cannot be pathlike)
+/// :param big_endian: Whether to serialize as big endian
+/// :type big_endian: bool
+/// :raises MsytError: Raises an `MsytError` if any path is absolute or contains `..`, if two
+///     paths name the same file, or if any of the files cannot be written.
+#[pyfunction]
+#[text_signature = "(msbts, output, big_endian)"]
+fn write_msbt_dir(py: Python, msbts: &PyDict, output: &str, big_endian: bool) -> PyResult<()> {
+    let output = Path::new(output);
+    let mut names = BTreeSet::new();
+    let mut jobs: Vec<(PathBuf, Msyt)> = Vec::with_capacity(msbts.len());
+    for (name, msbt) in msbts.iter() {
+        let name: &str = name.extract()?;
+        let relative = safe_relative_path(name)?;
+        let path = output.join(&relative);
+        if !names.insert(relative) {
+            return Err(MsytError::new_err(format!(
+                "{} names the same MSBT file as another path",
+                name
+            )));
+        }
+        let msbt: PyRef<Msbt> = msbt.extract()?;
+        jobs.push((path, msbt.msyt.clone()));
+    }
+    py.allow_threads(|| -> PyResult<()> {
+        create_parents(jobs.iter().map(|(path, _)| path.as_path()))?;
+        jobs.into_par_iter()
+            .try_for_each(|(path, msyt)| -> PyResult<()> {
+                let mut writer = BufWriter::new(fs::File::create(&path)?);
+                msyt.write_as_msbt(&mut writer, endianness(big_endian))
+                    .map_err(|e| {
+                        MsytError::new_err(format!("Could not write MSBT file: {:?}", e))
+                    })?;
+                writer.flush()?;
+                Ok(())
             })
-            .map_err(|e| MsytError::new_err(format!("Failed to create MSBT files: {:?}", e)))?;
+    })
+}
+
+/// Drops every parsed MSBT file kept by `Msbt.from_file()` or `read_msbt_dir()` with
+/// `cache=True`.
+#[pyfunction]
+#[text_signature = "()"]
+fn clear_cache() {
+    MSYT_CACHE.lock().unwrap().clear();
+}
+
+/// Parses an MSBT file from disk. With `cache` set, a copy of the result is kept, and later
+/// reads of the same file return that copy for as long as the file's modification time and
+/// size stay the same.
+fn read_msbt_file(path: &Path, cache: bool) -> PyResult<Msyt> {
+    let read_error = |path: &Path, e: &dyn std::fmt::Debug| {
+        MsytError::new_err(format!(
+            "Could not read MSBT file {}: {:?}",
+            path.to_string_lossy(),
+            e
+        ))
+    };
+    let parse = |path: &Path| Msyt::from_msbt_file(path).map_err(|e| read_error(path, &e));
+    if !cache {
+        return parse(path);
+    }
+    let path = fs::canonicalize(path).map_err(|e| read_error(path, &e))?;
+    let (modified, len) = fs::metadata(&path)
+        .and_then(|metadata| Ok((metadata.modified()?, metadata.len())))
+        .map_err(|e| read_error(&path, &e))?;
+    let cached = MSYT_CACHE
+        .lock()
+        .unwrap()
+        .get(&path)
+        .filter(|cached| cached.modified == modified && cached.len == len)
+        .map(|cached| Arc::clone(&cached.msyt));
+    if let Some(msyt) = cached {
+        return Ok(Msyt::clone(&msyt));
+    }
+    let msyt = parse(path.as_path())?;
+    let cached = Arc::new(msyt.clone());
+    MSYT_CACHE.lock().unwrap().insert(
+        path,
+        CachedMsyt {
+            modified,
+            len,
+            msyt: cached,
+        },
+    );
+    Ok(msyt)
+}
+
+/// Creates the parent folders of a set of output files, calling `create_dir_all` only once
+/// for each distinct folder rather than once per file.
+fn create_parents<'a, I: Iterator<Item = &'a Path>>(files: I) -> PyResult<()> {
+    let parents: BTreeSet<&Path> = files.filter_map(|f| f.parent()).collect();
+    for parent in parents {
+        fs::create_dir_all(parent).map_err(|e| {
+            MsytError::new_err(format!(
+                "Could not create output folder {}: {:?}",
+                parent.to_string_lossy(),
+                e
+            ))
+        })?;
+    }
+    Ok(())
+}
+
+/// Recursively finds every file with the given extension in a folder. This uses the file
+/// type reported by each directory entry instead of running `stat` on every path the way a
+/// `**` glob does. Entries that cannot be inspected, such as dangling symlinks, are skipped,
+/// as are symlinks back to a folder already being walked, so that symlink loops terminate.
+fn find_files(dir: &Path, ext: &str) -> PyResult<Vec<PathBuf>> {
+    fn read_error(dir: &Path, e: std::io::Error) -> PyErr {
+        MsytError::new_err(format!(
+            "Could not read folder {}: {:?}",
+            dir.to_string_lossy(),
+            e
+        ))
+    }
+
+    /// `ancestors` holds the canonical path of every folder from the root down to `dir`.
+    fn walk(
+        dir: &Path,
+        ext: &OsStr,
+        ancestors: &mut Vec<PathBuf>,
+        files: &mut Vec<PathBuf>,
+    ) -> PyResult<()> {
+        let entries = fs::read_dir(dir).map_err(|e| read_error(dir, e))?;
+        for entry in entries.filter_map(|e| e.ok()) {
+            let path = entry.path();
+            let (file_type, link_target) = match entry.file_type() {
+                Ok(t) if t.is_symlink() => {
+                    let metadata = match fs::metadata(&path) {
+                        Ok(metadata) => metadata,
+                        Err(_) => continue,
+                    };
+                    if metadata.is_dir() {
+                        match fs::canonicalize(&path) {
+                            Ok(target) if !ancestors.contains(&target) => {
+                                (metadata.file_type(), Some(target))
+                            }
+                            _ => continue,
+                        }
+                    } else {
+                        (metadata.file_type(), None)
+                    }
+                }
+                Ok(t) => (t, None),
+                Err(_) => continue,
+            };
+            if file_type.is_dir() {
+                let target = link_target
+                    .unwrap_or_else(|| ancestors.last().unwrap().join(entry.file_name()));
+                ancestors.push(target);
+                let result = walk(&path, ext, ancestors, files);
+                ancestors.pop();
+                result?;
+            } else if file_type.is_file() && path.extension() == Some(ext) {
+                files.push(path);
+            }
+        }
         Ok(())
-    } else if input.is_file() {
-        let output = if let Some(output) = output {
-            output.into()
-        } else {
-            input.with_extension("msbt")
-        };
-        create_single(&input, &output, big_endian)
+    }
+
+    let root = fs::canonicalize(dir).map_err(|e| read_error(dir, e))?;
+    let mut files = vec![];
+    walk(dir, OsStr::new(ext), &mut vec![root], &mut files)?;
+    Ok(files)
+}
+
+/// Checks that a caller-supplied relative file name stays inside the folder it is joined to,
+/// rejecting empty and absolute paths and any `..` components. The path is returned
+/// normalized (without `.` components or repeated separators), so that two names for the
+/// same file compare equal.
+fn safe_relative_path(name: &str) -> PyResult<PathBuf> {
+    let invalid = || MsytError::new_err(format!("{} is not a valid relative MSBT file path", name));
+    let mut path = PathBuf::new();
+    for component in Path::new(name).components() {
+        match component {
+            Component::Normal(part) => path.push(part),
+            Component::CurDir => {}
+            _ => return Err(invalid()),
+        }
+    }
+    if path.as_os_str().is_empty() {
+        Err(invalid())
     } else {
-        Err(MsytError::new_err(format!(
-            "{} is not a valid file or folder",
-            input.to_string_lossy()
-        )))
+        Ok(path)
+    }
+}
+
+/// Gets the path of a file relative to a folder, always using `/` as the separator.
+fn relative_name(root: &Path, file: &Path) -> String {
+    let name = file.strip_prefix(root).unwrap().to_string_lossy();
+    if cfg!(windows) {
+        name.replace('\\', "/")
+    } else {
+        name.into_owned()
     }
 }
 
+/// Maps a file found in an input folder to its place in the output folder, with a new
+/// extension, building the path in a single allocation.
+fn output_path(input: &Path, output: &Path, file: &Path, ext: &str) -> PathBuf {
+    let mut path = output.join(file.strip_prefix(input).unwrap());
+    path.set_extension(ext);
+    path
+}
+
+/// Maps the `big_endian` flag taken by the Python API to an MSBT byte order.
+fn endianness(big_endian: bool) -> Endianness {
+    if big_endian {
+        Endianness::Big
+    } else {
+        Endianness::Little
+    }
+}
+
+/// Parses MSYT text which may be either YAML or JSON. JSON is a subset of YAML, but
+/// `serde_json` is far faster than `serde_yaml`, so anything that looks like a JSON
+/// object is tried as JSON first and only falls back to YAML if that fails. If neither
+/// parser succeeds, the error from the parser matching the sniffed format is reported,
+/// prefixed by `error`.
+fn parse_msyt_text(text: &str, error: &str) -> PyResult<Msyt> {
+    let result: Result<Msyt, String> = if text.trim_start().starts_with('{') {
+        serde_json::from_str(text)
+            .or_else(|e| serde_yaml::from_str(text).map_err(|_| format!("{:?}", e)))
+    } else {
+        serde_yaml::from_str(text)
+            .or_else(|e| serde_json::from_str(text).map_err(|_| format!("{:?}", e)))
+    };
+    result.map_err(|e| MsytError::new_err(format!("{}: {}", error, e)))
+}
+
 #[pyclass]
 /// Class representing an MSBT file. This is just a thin wrapper over the `Msyt` type from
 /// the Rust MSYT project providing a few convenient methods for Python use. Note that
@@ -204,18 +477,41 @@ pub struct Msbt {
 
 #[pymethods]
 impl Msbt {
-    /// Parses an MSBT file from a bytes object
+    /// Parses an MSBT file from a bytes-like object. Any object supporting the buffer
+    /// protocol is accepted, so a large file can be passed as an `mmap.mmap` and parsed
+    /// straight from the mapped pages instead of being read into memory first. Contiguous
+    /// buffers are read in place, so the underlying memory (including the file behind an
+    /// `mmap.mmap`) **must not** be written to or truncated by anything, including other
+    /// processes, until this call returns.
     ///
     /// :param data: The bytes of the MSBT file to parse.
-    /// :type data: bytes (*only* bytes proper, *not* byteslike)
+    /// :type data: bytes-like (`bytes`, `bytearray`, `memoryview`, `mmap.mmap`, etc.)
     /// :return: Returns a parsed `pymsyt.Msbt` class representing the MSBT file.
     /// :rtype: `pymsyt.Msbt`
     /// :raises MsytError: Raises an `MsytError` if parsing fails.
     #[staticmethod]
     #[text_signature = "(data, /)"]
-    pub fn from_binary(data: &[u8]) -> PyResult<Self> {
-        let msyt = Msyt::from_msbt_bytes(data)
-            .map_err(|e| MsytError::new_err(format!("Failed to parse MSBT file: {:?}", e)))?;
+    pub fn from_binary(py: Python, data: &PyAny) -> PyResult<Self> {
+        let msyt = if let Ok(bytes) = data.downcast::<PyBytes>() {
+            Msyt::from_msbt_bytes(bytes.as_bytes())
+        } else {
+            let buffer = PyBuffer::<u8>::get(data)?;
+            if buffer.is_c_contiguous() {
+                // SAFETY: the buffer is contiguous and stays exported while `buffer` is
+                // alive, so Python cannot resize or close it, and holding the GIL keeps other
+                // Python threads from writing to it. Nothing here can stop another process
+                // from changing or truncating a file-backed mapping, though; the docstring
+                // makes keeping the memory unchanged for the duration of the call the
+                // caller's responsibility.
+                let data = unsafe {
+                    std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, buffer.len_bytes())
+                };
+                Msyt::from_msbt_bytes(data)
+            } else {
+                Msyt::from_msbt_bytes(&buffer.to_vec(py)?)
+            }
+        }
+        .map_err(|e| MsytError::new_err(format!("Failed to parse MSBT file: {:?}", e)))?;
         Ok(Msbt { msyt })
     }
 
@@ -227,18 +523,13 @@ impl Msbt {
     /// :rtype: bytes
     /// :raises MsytError: Raises an `MsytError` if serialization fails.
     #[text_signature = "($self, big_endian, /)"]
-    pub fn to_binary(&self, big_endian: bool) -> PyResult<Py<PyAny>> {
-        let gil = Python::acquire_gil();
-        let py = gil.python();
+    pub fn to_binary(&self, py: Python, big_endian: bool) -> PyResult<Py<PyAny>> {
         Ok(PyBytes::new(
             py,
             &self
                 .msyt
                 .clone()
-                .into_msbt_bytes(match big_endian {
-                    true => Endianness::Big,
-                    false => Endianness::Little,
-                })
+                .into_msbt_bytes(endianness(big_endian))
                 .map_err(|e| {
                     MsytError::new_err(format!("Failed to serialize MSBT file: {:?}", e))
                 })?,
@@ -246,6 +537,41 @@ impl Msbt {
         .into())
     }
 
+    /// Parses an MSBT file straight from disk, without first reading it into a Python bytes
+    /// object.
+    ///
+    /// :param path: The path of the MSBT file to parse.
+    /// :type path: str (**must** be str, cannot be pathlike)
+    /// :param cache: Whether to reuse (and keep) a parsed copy of the file while it is unchanged
+    /// :type cache: bool, optional. Defaults to False.
+    /// :return: Returns a parsed `pymsyt.Msbt` class representing the MSBT file.
+    /// :rtype: `pymsyt.Msbt`
+    /// :raises MsytError: Raises an `MsytError` if parsing fails.
+    #[staticmethod]
+    #[text_signature = "(path, /, cache=False)"]
+    pub fn from_file(path: &str, cache: Option<bool>) -> PyResult<Self> {
+        let msyt = read_msbt_file(Path::new(path), cache.unwrap_or(false))?;
+        Ok(Msbt { msyt })
+    }
+
+    /// Serializes this MSBT file straight to disk, without building a Python bytes object.
+    ///
+    /// :param path: The path to write the MSBT file to.
+    /// :type path: str (**must** be str, cannot be pathlike)
+    /// :param big_endian: Whether to serialize as big endian (Wii U) or little endian (Switch)
+    /// :type big_endian: bool
+    /// :raises MsytError: Raises an `MsytError` if serialization fails.
+    #[text_signature = "($self, path, big_endian, /)"]
+    pub fn to_file(&self, path: &str, big_endian: bool) -> PyResult<()> {
+        let mut writer = BufWriter::new(fs::File::create(path)?);
+        self.msyt
+            .clone()
+            .write_as_msbt(&mut writer, endianness(big_endian))
+            .map_err(|e| MsytError::new_err(format!("Failed to serialize MSBT file: {:?}", e)))?;
+        writer.flush()?;
+        Ok(())
+    }
+
     /// Generates a YAML representation of this MSBT file.
     ///
     /// :return: Returns the MSBT as a YAML string.
@@ -268,7 +594,8 @@ impl Msbt {
             .map_err(|e| MsytError::new_err(format!("Failed to dump MSBT to JSON: {:?}", e)))?)
     }
 
-    /// Parses an MSBT file from a YAML representation.
+    /// Parses an MSBT file from a YAML representation. Since JSON is a subset of YAML, JSON
+    /// text is accepted as well, and is parsed with the much faster JSON parser.
     ///
     /// :param yaml: The text of the YAML to parse.
     /// :type yaml: str
@@ -277,11 +604,9 @@ impl Msbt {
     /// :raises MsytError: Raises an `MsytError` if parsing fails.
     #[staticmethod]
     #[text_signature = "(yaml, /)"]
-    pub fn from_yaml(yaml: String) -> PyResult<Self> {
+    pub fn from_yaml(yaml: &str) -> PyResult<Self> {
         Ok(Self {
-            msyt: serde_yaml::from_str(&yaml).map_err(|e| {
-                MsytError::new_err(format!("Could not parse YAML to MSBT: {:?}", e))
-            })?,
+            msyt: parse_msyt_text(yaml, "Could not parse YAML to MSBT")?,
         })
     }
 
@@ -294,9 +619,9 @@ impl Msbt {
     /// :raises MsytError: Raises an `MsytError` if parsing fails.
     #[staticmethod]
     #[text_signature = "(json, /)"]
-    pub fn from_json(json: String) -> PyResult<Self> {
+    pub fn from_json(json: &str) -> PyResult<Self> {
         Ok(Self {
-            msyt: serde_json::from_str(&json).map_err(|e| {
+            msyt: serde_json::from_str(json).map_err(|e| {
                 MsytError::new_err(format!("Could not parse JSON to MSBT: {:?}", e))
             })?,
         })
@@ -308,15 +633,11 @@ impl Msbt {
     /// :rtype: dict
     /// :raises MsytError: Raises an `MsytError` if conversion fails.
     #[text_signature = "($self)"]
-    pub fn to_dict(&self) -> PyResult<Py<PyAny>> {
-        let gil = Python::acquire_gil();
-        let py = gil.python();
-        let text = self.to_json()?;
-        let json = PyModule::import(py, "json")?;
-        let dict = json.call("loads", (text,), None).map_err(|e| {
+    pub fn to_dict(&self, py: Python) -> PyResult<Py<PyAny>> {
+        let value = serde_json::to_value(&self.msyt).map_err(|e| {
             MsytError::new_err(format!("Could not serialize MSBT to Python dict: {:?}", e))
         })?;
-        Ok(Py::from(dict))
+        json_to_py(py, &value)
     }
 
     /// Parses an MSBT file from a Python dictionary.
@@ -329,11 +650,129 @@ impl Msbt {
     #[staticmethod]
     #[text_signature = "(dict, /)"]
     pub fn from_dict(dict: &PyDict) -> PyResult<Self> {
-        let gil = Python::acquire_gil();
-        let py = gil.python();
-        let json = PyModule::import(py, "json")?;
-        let res = json.call("dumps", (dict,), None)?;
-        let text = res.downcast::<PyString>()?;
-        Self::from_json(text.to_string())
+        Ok(Self {
+            msyt: serde_json::from_value(py_to_json(dict)?).map_err(|e| {
+                MsytError::new_err(format!("Could not parse Python dict to MSBT: {:?}", e))
+            })?,
+        })
+    }
+}
+
+/// Converts a JSON value straight into the equivalent Python object, skipping the
+/// round trip through JSON text and the Python `json` module. MSYT data repeats the same
+/// few keys (`contents`, `text`, `control`, ...) in every entry, so each distinct key is
+/// only made into a Python string once and shared by every dict that uses it.
+fn json_to_py(py: Python, value: &Value) -> PyResult<Py<PyAny>> {
+    fn convert<'a>(
+        py: Python,
+        value: &'a Value,
+        keys: &mut HashMap<&'a str, Py<PyAny>>,
+    ) -> PyResult<Py<PyAny>> {
+        Ok(match value {
+            Value::Null => py.None(),
+            Value::Bool(b) => b.to_object(py),
+            Value::Number(n) => {
+                if let Some(i) = n.as_i64() {
+                    i.to_object(py)
+                } else if let Some(u) = n.as_u64() {
+                    u.to_object(py)
+                } else {
+                    n.as_f64().unwrap_or_default().to_object(py)
+                }
+            }
+            Value::String(s) => s.to_object(py),
+            Value::Array(items) => {
+                let list = PyList::empty(py);
+                for item in items {
+                    list.append(convert(py, item, keys)?)?;
+                }
+                list.to_object(py)
+            }
+            Value::Object(map) => {
+                let dict = PyDict::new(py);
+                for (key, item) in map {
+                    let key = keys
+                        .entry(key.as_str())
+                        .or_insert_with(|| key.to_object(py))
+                        .clone_ref(py);
+                    dict.set_item(key, convert(py, item, keys)?)?;
+                }
+                dict.to_object(py)
+            }
+        })
+    }
+
+    convert(py, value, &mut HashMap::new())
+}
+
+/// Converts a Python object made of dicts, lists, and scalars into a JSON value.
+fn py_to_json(obj: &PyAny) -> PyResult<Value> {
+    if obj.is_none() {
+        Ok(Value::Null)
+    } else if let Ok(b) = obj.downcast::<PyBool>() {
+        Ok(Value::Bool(b.is_true()))
+    } else if let Ok(i) = obj.downcast::<PyLong>() {
+        match i.extract::<i64>() {
+            Ok(i) => Ok(Value::from(i)),
+            Err(_) => i
+                .extract::<u64>()
+                .map(Value::from)
+                .map_err(|_| MsytError::new_err(format!("{} is not a valid MSYT number", i))),
+        }
+    } else if let Ok(f) = obj.downcast::<PyFloat>() {
+        Number::from_f64(f.value())
+            .map(Value::Number)
+            .ok_or_else(|| MsytError::new_err(format!("{} is not a valid MSYT number", f.value())))
+    } else if let Ok(s) = obj.downcast::<PyString>() {
+        Ok(Value::String(s.to_str()?.to_owned()))
+    } else if let Ok(dict) = obj.downcast::<PyDict>() {
+        let mut map = Map::with_capacity(dict.len());
+        for (key, item) in dict.iter() {
+            map.insert(json_key(key)?, py_to_json(item)?);
+        }
+        Ok(Value::Object(map))
+    } else if let Ok(list) = obj.downcast::<PyList>() {
+        Ok(Value::Array(
+            list.iter().map(py_to_json).collect::<PyResult<_>>()?,
+        ))
+    } else if let Ok(tuple) = obj.downcast::<PyTuple>() {
+        Ok(Value::Array(
+            tuple.iter().map(py_to_json).collect::<PyResult<_>>()?,
+        ))
+    } else {
+        Err(MsytError::new_err(format!(
+            "Could not convert Python type {} to MSBT data",
+            obj.get_type().name()
+        )))
+    }
+}
+
+/// Converts a Python dict key to a JSON object key the same way `json.dumps` does, turning
+/// `int`, `float`, `bool` and `None` keys into strings.
+fn json_key(key: &PyAny) -> PyResult<String> {
+    if let Ok(s) = key.downcast::<PyString>() {
+        Ok(s.to_str()?.to_owned())
+    } else if key.is_none() {
+        Ok("null".to_owned())
+    } else if let Ok(b) = key.downcast::<PyBool>() {
+        Ok(if b.is_true() { "true" } else { "false" }.to_owned())
+    } else if key.downcast::<PyLong>().is_ok() {
+        Ok(key.str()?.to_str()?.to_owned())
+    } else if let Ok(f) = key.downcast::<PyFloat>() {
+        let value = f.value();
+        Ok(if value.is_nan() {
+            "NaN".to_owned()
+        } else if value == f64::INFINITY {
+            "Infinity".to_owned()
+        } else if value == f64::NEG_INFINITY {
+            "-Infinity".to_owned()
+        } else {
+            key.repr()?.to_str()?.to_owned()
+        })
+    } else {
+        Err(MsytError::new_err(format!(
+            "Could not convert dict key of Python type {} to MSBT data",
+            key.get_type().name()
+        )))
     }
 }